@@ -0,0 +1,118 @@
+"""
+Kernels for geometric analysis of the positions in a frame. The kernels are
+compiled with numba when it is installed, and use vectorized numpy code
+otherwise. numba is only imported when a kernel is used for the first time, to
+keep ``import chemfiles`` cheap.
+
+Distance kernels are specialized for each cell shape, so that the choice of
+periodic boundary conditions happens once per call, outside of the loop over
+pairs of atoms.
+"""
+
+import numpy as np
+
+
+def _numpy_delta(values):
+    return values[np.newaxis, :] - values[:, np.newaxis]
+
+
+# The numpy kernels work on one (N, N) component at a time, updating arrays in
+# place where possible to keep the peak memory use to a few times the size of
+# the result.
+
+
+def _pairwise_distances_infinite_numpy(x, y, z):
+    distances = np.zeros((x.shape[0], x.shape[0]), dtype=np.float64)
+    for values in (x, y, z):
+        delta = _numpy_delta(values)
+        delta *= delta
+        distances += delta
+    return np.sqrt(distances, out=distances)
+
+
+def _pairwise_distances_orthorhombic_numpy(x, y, z, lengths):
+    distances = np.zeros((x.shape[0], x.shape[0]), dtype=np.float64)
+    for values, length in zip((x, y, z), lengths):
+        delta = _numpy_delta(values)
+        shift = delta / length
+        np.rint(shift, out=shift)
+        shift *= length
+        delta -= shift
+        delta *= delta
+        distances += delta
+    return np.sqrt(distances, out=distances)
+
+
+def _pairwise_distances_triclinic_numpy(x, y, z, matrix, inverse):
+    # chemfiles cell matrices (and their inverses) are upper triangular, which
+    # allows converting to fractional coordinates and back in place, one
+    # component at a time
+    dx = _numpy_delta(x)
+    dy = _numpy_delta(y)
+    dz = _numpy_delta(z)
+
+    dx *= inverse[0, 0]
+    dx += inverse[0, 1] * dy
+    dx += inverse[0, 2] * dz
+    dy *= inverse[1, 1]
+    dy += inverse[1, 2] * dz
+    dz *= inverse[2, 2]
+
+    for fractional in (dx, dy, dz):
+        fractional -= np.rint(fractional)
+
+    dx *= matrix[0, 0]
+    dx += matrix[0, 1] * dy
+    dx += matrix[0, 2] * dz
+    dy *= matrix[1, 1]
+    dy += matrix[1, 2] * dz
+    dz *= matrix[2, 2]
+
+    distances = dx
+    distances *= dx
+    dy *= dy
+    distances += dy
+    dz *= dz
+    distances += dz
+    return np.sqrt(distances, out=distances)
+
+
+def _center_of_mass_numpy(x, y, z, masses):
+    return np.array((masses @ x, masses @ y, masses @ z)) / np.sum(masses)
+
+
+# Kernels already selected, indexed by name
+_KERNELS = {}
+
+
+def _kernel(name):
+    """
+    Get the kernel with the given ``name``, using the numba version if numba
+    is installed, and the numpy version otherwise.
+    """
+    kernel = _KERNELS.get(name)
+    if kernel is None:
+        try:
+            from . import _numba_kernels
+
+            kernel = getattr(_numba_kernels, f"_{name}_numba")
+        except ImportError:
+            kernel = globals()[f"_{name}_numpy"]
+        _KERNELS[name] = kernel
+    return kernel
+
+
+def pairwise_distances_infinite(x, y, z):
+    return _kernel("pairwise_distances_infinite")(x, y, z)
+
+
+def pairwise_distances_orthorhombic(x, y, z, lengths):
+    return _kernel("pairwise_distances_orthorhombic")(x, y, z, lengths)
+
+
+def pairwise_distances_triclinic(x, y, z, matrix, inverse):
+    return _kernel("pairwise_distances_triclinic")(x, y, z, matrix, inverse)
+
+
+def center_of_mass(x, y, z, masses):
+    return _kernel("center_of_mass")(x, y, z, masses)
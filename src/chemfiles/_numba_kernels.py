@@ -0,0 +1,76 @@
+"""
+numba versions of the kernels in :py:mod:`chemfiles._kernels`. This module
+is only imported (and numba with it) the first time one of the kernels is
+used.
+"""
+
+import numba
+import numpy as np
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _pairwise_distances_infinite_numba(x, y, z):
+    n = x.shape[0]
+    distances = np.empty((n, n), dtype=np.float64)
+    for i in numba.prange(n):
+        for j in range(n):
+            dx = x[j] - x[i]
+            dy = y[j] - y[i]
+            dz = z[j] - z[i]
+            distances[i, j] = np.sqrt(dx * dx + dy * dy + dz * dz)
+    return distances
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _pairwise_distances_orthorhombic_numba(x, y, z, lengths):
+    n = x.shape[0]
+    a = lengths[0]
+    b = lengths[1]
+    c = lengths[2]
+    distances = np.empty((n, n), dtype=np.float64)
+    for i in numba.prange(n):
+        for j in range(n):
+            dx = x[j] - x[i]
+            dy = y[j] - y[i]
+            dz = z[j] - z[i]
+            dx -= a * np.rint(dx / a)
+            dy -= b * np.rint(dy / b)
+            dz -= c * np.rint(dz / c)
+            distances[i, j] = np.sqrt(dx * dx + dy * dy + dz * dz)
+    return distances
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _pairwise_distances_triclinic_numba(x, y, z, matrix, inverse):
+    n = x.shape[0]
+    distances = np.empty((n, n), dtype=np.float64)
+    for i in numba.prange(n):
+        for j in range(n):
+            dx = x[j] - x[i]
+            dy = y[j] - y[i]
+            dz = z[j] - z[i]
+            fx = inverse[0, 0] * dx + inverse[0, 1] * dy + inverse[0, 2] * dz
+            fy = inverse[1, 0] * dx + inverse[1, 1] * dy + inverse[1, 2] * dz
+            fz = inverse[2, 0] * dx + inverse[2, 1] * dy + inverse[2, 2] * dz
+            fx -= np.rint(fx)
+            fy -= np.rint(fy)
+            fz -= np.rint(fz)
+            dx = matrix[0, 0] * fx + matrix[0, 1] * fy + matrix[0, 2] * fz
+            dy = matrix[1, 0] * fx + matrix[1, 1] * fy + matrix[1, 2] * fz
+            dz = matrix[2, 0] * fx + matrix[2, 1] * fy + matrix[2, 2] * fz
+            distances[i, j] = np.sqrt(dx * dx + dy * dy + dz * dz)
+    return distances
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True, error_model="numpy")
+def _center_of_mass_numba(x, y, z, masses):
+    total = 0.0
+    cx = 0.0
+    cy = 0.0
+    cz = 0.0
+    for i in numba.prange(x.shape[0]):
+        total += masses[i]
+        cx += masses[i] * x[i]
+        cy += masses[i] * y[i]
+        cz += masses[i] * z[i]
+    return np.array((cx / total, cy / total, cz / total))
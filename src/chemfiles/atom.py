@@ -35,10 +35,13 @@ class Atom(CxxPointer):
         return Atom.from_mutable_ptr(None, self.ffi.chfl_atom_copy(self.ptr))
 
     def __repr__(self):
-        if self.type == self.name:
-            return f"Atom('{self.name}')"
+        # get name and type only once, each access goes through the C API
+        name = self.name
+        type = self.type
+        if type == name:
+            return f"Atom('{name}')"
         else:
-            return f"Atom('{self.name}', '{self.type}')"
+            return f"Atom('{name}', '{type}')"
 
     @property
     def mass(self):
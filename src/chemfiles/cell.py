@@ -52,7 +52,7 @@ class UnitCell(CxxPointer):
         If the three angles are equal to 90.0, the new unit cell shape is
         ``CellShape.Orthorhombic``. Else it is ``CellShape.Infinite``.
         """
-        lengths = np.array(lengths)
+        lengths = np.ascontiguousarray(lengths, dtype=np.float64)
         if len(lengths.shape) == 1:
             lengths = chfl_vector3d(*lengths)
             angles = chfl_vector3d(*angles)
@@ -62,18 +62,9 @@ class UnitCell(CxxPointer):
                 raise ChemfilesError(
                     f"expected the cell matrix to have 3x3 shape, got {lengths.shape}"
                 )
-            matrix = ARRAY(chfl_vector3d, (3))()
-            matrix[0][0] = lengths[0, 0]
-            matrix[0][1] = lengths[0, 1]
-            matrix[0][2] = lengths[0, 2]
-
-            matrix[1][0] = lengths[1, 0]
-            matrix[1][1] = lengths[1, 1]
-            matrix[1][2] = lengths[1, 2]
-
-            matrix[2][0] = lengths[2, 0]
-            matrix[2][1] = lengths[2, 1]
-            matrix[2][2] = lengths[2, 2]
+            # lengths is a C-contiguous 3x3 array of float64, with the exact
+            # same memory layout as chfl_vector3d[3]
+            matrix = ARRAY(chfl_vector3d, 3).from_buffer_copy(lengths)
             ptr = self.ffi.chfl_cell_from_matrix(matrix)
 
         super(UnitCell, self).__init__(ptr, is_const=False)
@@ -92,9 +83,9 @@ class UnitCell(CxxPointer):
     @property
     def lengths(self):
         """Get the three lengths of this :py:class:`UnitCell`, in Angstroms."""
-        lengths = chfl_vector3d(0, 0, 0)
+        lengths = chfl_vector3d()
         self.ffi.chfl_cell_lengths(self.ptr, lengths)
-        return lengths[0], lengths[1], lengths[2]
+        return tuple(lengths)
 
     @lengths.setter
     def lengths(self, lengths):
@@ -108,9 +99,9 @@ class UnitCell(CxxPointer):
     @property
     def angles(self):
         """Get the three angles of this :py:class:`UnitCell`, in degrees."""
-        angles = chfl_vector3d(0, 0, 0)
+        angles = chfl_vector3d()
         self.ffi.chfl_cell_angles(self.ptr, angles)
-        return angles[0], angles[1], angles[2]
+        return tuple(angles)
 
     @angles.setter
     def angles(self, angles):
@@ -137,15 +128,9 @@ class UnitCell(CxxPointer):
             |  0    b_y   c_y |
             |  0     0    c_z |
         """
-        m = ARRAY(chfl_vector3d, 3)()
-        self.ffi.chfl_cell_matrix(self.ptr, m)
-        return np.array(
-            (
-                (m[0][0], m[0][1], m[0][2]),
-                (m[1][0], m[1][1], m[1][2]),
-                (m[2][0], m[2][1], m[2][2]),
-            )
-        )
+        matrix = ARRAY(chfl_vector3d, 3)()
+        self.ffi.chfl_cell_matrix(self.ptr, matrix)
+        return np.ctypeslib.as_array(matrix)
 
     @property
     def shape(self):
@@ -173,4 +158,4 @@ class UnitCell(CxxPointer):
         """
         vector = chfl_vector3d(vector[0], vector[1], vector[2])
         self.ffi.chfl_cell_wrap(self.ptr, vector)
-        return (vector[0], vector[1], vector[2])
+        return tuple(vector)
@@ -1,14 +1,41 @@
-from ctypes import POINTER, c_bool, c_char_p, c_double, c_uint64
+from ctypes import POINTER, addressof, c_bool, c_char_p, c_double, c_uint64
 
 import numpy as np
 
 from ._c_api import chfl_bond_order, chfl_vector3d
+from ._kernels import (
+    center_of_mass,
+    pairwise_distances_infinite,
+    pairwise_distances_orthorhombic,
+    pairwise_distances_triclinic,
+)
 from .atom import Atom
-from .cell import UnitCell
+from .cell import CellShape, UnitCell
 from .misc import ChemfilesError
 from .property import Property
 from .topology import Topology
-from .utils import CxxPointer
+from .utils import CxxPointer, _aligned_empty
+
+# Resolve the pointer type once instead of on every positions/velocities access
+_chfl_vector3d_ptr = POINTER(chfl_vector3d)
+
+
+def _vector3d_array(origin, data, count):
+    """
+    Create a ``(count, 3)`` numpy array viewing the ``count`` chfl_vector3d
+    starting at ``data``. No memory is allocated or copied for the values.
+
+    The memory is owned by ``origin``, which is kept alive as long as the
+    array is alive.
+    """
+    if count != 0:
+        buffer = (c_double * (3 * count)).from_address(addressof(data.contents))
+        # the array keeps a reference to the buffer, which keeps a reference
+        # to the origin
+        buffer._origin = origin
+        return np.frombuffer(buffer, dtype=np.float64).reshape((count, 3))
+    else:
+        return np.empty((0, 3), dtype=np.float64)
 
 
 class FrameAtoms(object):
@@ -31,14 +58,16 @@ class FrameAtoms(object):
         if index >= len(self):
             raise IndexError(f"atom index ({index}) out of range for this frame")
         else:
-            ptr = self.frame.ffi.chfl_atom_from_frame(
-                self.frame.mut_ptr, c_uint64(index)
-            )
-            return Atom.from_mutable_ptr(self, ptr)
+            return self._atom(index)
 
     def __iter__(self):
+        # only get the number of atoms once, instead of once per atom
         for i in range(len(self)):
-            yield self[i]
+            yield self._atom(i)
+
+    def _atom(self, index):
+        ptr = self.frame.ffi.chfl_atom_from_frame(self.frame.mut_ptr, c_uint64(index))
+        return Atom.from_mutable_ptr(self, ptr)
 
     def __repr__(self):
         return "[" + ", ".join([atom.__repr__() for atom in self]) + "]"
@@ -90,7 +119,7 @@ class Frame(CxxPointer):
         atom.
         """
         position = chfl_vector3d(position[0], position[1], position[2])
-        if velocity:
+        if velocity is not None:
             velocity = chfl_vector3d(velocity[0], velocity[1], velocity[2])
         self.ffi.chfl_frame_add_atom(self.mut_ptr, atom.ptr, position, velocity)
 
@@ -147,8 +176,9 @@ class Frame(CxxPointer):
         """
         Get a view into the positions of this :py:class:`Frame`.
 
-        This function gives direct access to the positions as a numpy array.
-        Modifying the array will change the positions in the frame.
+        This function gives direct access to the positions as a numpy array,
+        without any copy. Modifying the array will change the positions in the
+        frame, and the frame is kept alive as long as the array is.
 
         If the frame is resized (by writing to it, calling
         :py:func:`Frame.resize`, :py:func:`Frame.add_atom`,
@@ -156,22 +186,18 @@ class Frame(CxxPointer):
         cause a segfault.
         """
         count = c_uint64()
-        data = POINTER(chfl_vector3d)()
+        data = _chfl_vector3d_ptr()
         self.ffi.chfl_frame_positions(self.mut_ptr, data, count)
-        count = count.value
-        if count != 0:
-            positions = np.ctypeslib.as_array(data, shape=(count,))
-            return positions.view(np.float64).reshape((count, 3))
-        else:
-            return np.array([[], [], []], dtype=np.float64)
+        return _vector3d_array(self, data, count.value)
 
     @property
     def velocities(self):
         """
         Get a view into the velocities of this :py:class:`Frame`.
 
-        This function gives direct access to the velocities as a numpy array.
-        Modifying the array will change the velocities in the frame.
+        This function gives direct access to the velocities as a numpy array,
+        without any copy. Modifying the array will change the velocities in the
+        frame, and the frame is kept alive as long as the array is.
 
         If the frame is resized (by writing to it, calling
         :py:func:`Frame.resize`, :py:func:`Frame.add_atom`,
@@ -179,14 +205,34 @@ class Frame(CxxPointer):
         cause a segfault.
         """
         count = c_uint64()
-        data = POINTER(chfl_vector3d)()
+        data = _chfl_vector3d_ptr()
         self.ffi.chfl_frame_velocities(self.mut_ptr, data, count)
-        count = count.value
-        if count != 0:
-            velocities = np.ctypeslib.as_array(data, shape=(count,))
-            return velocities.view(np.float64).reshape((count, 3))
-        else:
-            return np.array([[], [], []], dtype=np.float64)
+        return _vector3d_array(self, data, count.value)
+
+    def positions_soa(self, dtype=np.float64):
+        """
+        Get a copy of the positions of this :py:class:`Frame` as three arrays
+        ``(x, y, z)``, each one containing the coordinates of all atoms along
+        a single axis.
+
+        :py:attr:`Frame.positions` stores the three coordinates of each atom
+        next to one another. Vectorized code working on one axis at a time
+        (for example numba kernels) should prefer this layout, where each
+        array is contiguous in memory and starts on a 64 bytes boundary, to
+        allow aligned SIMD loads.
+
+        Chemfiles stores positions as ``np.float64``. Use ``dtype=np.float32``
+        to convert them to single precision as part of the copy.
+        """
+        positions = self.positions
+        count = positions.shape[0]
+        # pad each axis to a multiple of 64 bytes, so that they all start on
+        # an aligned address inside a single allocation
+        per_line = 64 // np.dtype(dtype).itemsize
+        padded = -(-count // per_line) * per_line
+        soa = _aligned_empty((3, padded), dtype)
+        soa[:, :count] = positions.T
+        return soa[0, :count], soa[1, :count], soa[2, :count]
 
     def add_velocities(self):
         """
@@ -272,6 +318,51 @@ class Frame(CxxPointer):
         self.ffi.chfl_frame_distance(self.ptr, c_uint64(i), c_uint64(j), distance)
         return distance.value
 
+    def pairwise_distances(self):
+        """
+        Get the ``(natoms, natoms)`` matrix of distances (in Ångströms)
+        between all pairs of atoms in this :py:class:`Frame`, taking periodic
+        boundary conditions into account.
+
+        This gives the same values as calling :py:func:`Frame.distance` for
+        all pairs, but is computed using a single vectorized kernel. The kernel
+        is compiled with numba (in parallel) if it is installed, and
+        specialized for the shape of the unit cell.
+
+        A :py:class:`ChemfilesError` is raised for triclinic cells with a
+        non-invertible matrix, for example when one of the lengths is zero.
+        """
+        cell = self.cell
+        shape = cell.shape
+        x, y, z = self.positions_soa()
+        if shape == CellShape.Orthorhombic:
+            lengths = np.array(cell.lengths, dtype=np.float64)
+            return pairwise_distances_orthorhombic(x, y, z, lengths)
+        elif shape == CellShape.Triclinic:
+            matrix = cell.matrix
+            try:
+                inverse = np.linalg.inv(matrix)
+            except np.linalg.LinAlgError:
+                raise ChemfilesError(
+                    "can not compute distances in a triclinic cell "
+                    "with a non-invertible matrix"
+                ) from None
+            return pairwise_distances_triclinic(x, y, z, matrix, inverse)
+        else:
+            return pairwise_distances_infinite(x, y, z)
+
+    def center_of_mass(self):
+        """
+        Get the center of mass of all the atoms in this :py:class:`Frame`,
+        using the positions as they are, without taking periodic boundary
+        conditions into account.
+
+        The computation uses numba (in parallel) if it is installed.
+        """
+        masses = np.array([atom.mass for atom in self.atoms], dtype=np.float64)
+        x, y, z = self.positions_soa()
+        return center_of_mass(x, y, z, masses)
+
     def angle(self, i, j, k):
         """
         Get the angle (in radians) formed by the atoms at indexes ``i``, ``j``
@@ -19,9 +19,9 @@ class Property(CxxPointer):
     def __init__(self, value):
         """Create a new property containing the given value"""
         if isinstance(value, bool):
-            ptr = self.ffi.chfl_property_bool(c_bool(value))
+            ptr = self.ffi.chfl_property_bool(value)
         elif isinstance(value, (float, int)):
-            ptr = self.ffi.chfl_property_double(c_double(value))
+            ptr = self.ffi.chfl_property_double(value)
         elif isinstance(value, str):
             ptr = self.ffi.chfl_property_string(value.encode("utf8"))
         elif _is_vector3d(value):
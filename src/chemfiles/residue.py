@@ -43,10 +43,8 @@ class ResidueAtoms(object):
         """
         if self.indexes is None:
             count = len(self)
-            self.indexes = np.zeros(count, np.uint64)
-            self.residue.ffi.chfl_residue_atoms(
-                self.residue.ptr, self.indexes, c_uint64(count)
-            )
+            self.indexes = np.empty(count, np.uint64)
+            self.residue.ffi.chfl_residue_atoms(self.residue.ptr, self.indexes, count)
 
         return self.indexes[i]
 
@@ -65,7 +65,7 @@ class Selection(CxxPointer):
         matching = c_uint64()
         self.ffi.chfl_selection_evaluate(self.mut_ptr, frame.ptr, matching)
 
-        matches = np.zeros(matching.value, chfl_match)
+        matches = np.empty(matching.value, chfl_match)
         self.ffi.chfl_selection_matches(self.mut_ptr, matches, matching)
 
         size = self.size
@@ -53,14 +53,18 @@ class TopologyAtoms(object):
         if index >= len(self):
             raise IndexError(f"atom index ({index}) out of range for this topology")
         else:
-            ptr = self.topology.ffi.chfl_atom_from_topology(
-                self.topology.mut_ptr, c_uint64(index)
-            )
-            return Atom.from_mutable_ptr(self, ptr)
+            return self._atom(index)
 
     def __iter__(self):
+        # only get the number of atoms once, instead of once per atom
         for i in range(len(self)):
-            yield self[i]
+            yield self._atom(i)
+
+    def _atom(self, index):
+        ptr = self.topology.ffi.chfl_atom_from_topology(
+            self.topology.mut_ptr, c_uint64(index)
+        )
+        return Atom.from_mutable_ptr(self, ptr)
 
     def __delitem__(self, index):
         self.remove(index)
@@ -85,6 +89,16 @@ class TopologyAtoms(object):
         """
         self.topology.ffi.chfl_topology_add_atom(self.topology.mut_ptr, atom.ptr)
 
+    def extend(self, atoms):
+        """
+        Add a copy of all the :py:class:`Atom` in the ``atoms`` iterable at the
+        end of this :py:class:`Topology`.
+        """
+        add_atom = self.topology.ffi.chfl_topology_add_atom
+        ptr = self.topology.mut_ptr
+        for atom in atoms:
+            add_atom(ptr, atom.ptr)
+
 
 class TopologyResidues(object):
     """Proxy object to get the residues in a topology"""
@@ -107,14 +121,18 @@ class TopologyResidues(object):
         if index >= len(self):
             raise IndexError(f"residue index ({index}) out of range for this topology")
         else:
-            ptr = self.topology.ffi.chfl_residue_from_topology(
-                self.topology.ptr, c_uint64(index)
-            )
-            return Residue.from_const_ptr(self, ptr)
+            return self._residue(index)
 
     def __iter__(self):
+        # only get the number of residues once, instead of once per residue
         for i in range(len(self)):
-            yield self[i]
+            yield self._residue(i)
+
+    def _residue(self, index):
+        ptr = self.topology.ffi.chfl_residue_from_topology(
+            self.topology.ptr, c_uint64(index)
+        )
+        return Residue.from_const_ptr(self, ptr)
 
     def __repr__(self):
         return "[" + ", ".join([residue.__repr__() for residue in self]) + "]"
@@ -225,8 +243,8 @@ class Topology(CxxPointer):
     def bonds(self):
         """Get the list of bonds in this :py:class:`Topology`."""
         count = self.bonds_count()
-        bonds = np.zeros((count, 2), np.uint64)
-        self.ffi.chfl_topology_bonds(self.ptr, bonds, c_uint64(count))
+        bonds = np.empty((count, 2), np.uint64)
+        self.ffi.chfl_topology_bonds(self.ptr, bonds, count)
         return bonds
 
     def bonds_order(self, i, j):
@@ -243,32 +261,32 @@ class Topology(CxxPointer):
         Get the list of bonds order for each bond in this :py:class:`Topology`.
         """
         count = self.bonds_count()
-        orders = np.zeros(count, chfl_bond_order)
-        self.ffi.chfl_topology_bond_orders(self.ptr, orders, c_uint64(count))
+        orders = np.empty(count, chfl_bond_order)
+        self.ffi.chfl_topology_bond_orders(self.ptr, orders, count)
         return list(map(BondOrder, orders))
 
     @property
     def angles(self):
         """Get the list of angles in this :py:class:`Topology`."""
         count = self.angles_count()
-        angles = np.zeros((count, 3), np.uint64)
-        self.ffi.chfl_topology_angles(self.ptr, angles, c_uint64(count))
+        angles = np.empty((count, 3), np.uint64)
+        self.ffi.chfl_topology_angles(self.ptr, angles, count)
         return angles
 
     @property
     def dihedrals(self):
         """Get the list of dihedral angles in this :py:class:`Topology`."""
         count = self.dihedrals_count()
-        dihedrals = np.zeros((count, 4), np.uint64)
-        self.ffi.chfl_topology_dihedrals(self.ptr, dihedrals, c_uint64(count))
+        dihedrals = np.empty((count, 4), np.uint64)
+        self.ffi.chfl_topology_dihedrals(self.ptr, dihedrals, count)
         return dihedrals
 
     @property
     def impropers(self):
         """Get the list of improper angles in this :py:class:`Topology`."""
         count = self.impropers_count()
-        impropers = np.zeros((count, 4), np.uint64)
-        self.ffi.chfl_topology_impropers(self.ptr, impropers, c_uint64(count))
+        impropers = np.empty((count, 4), np.uint64)
+        self.ffi.chfl_topology_impropers(self.ptr, impropers, count)
         return impropers
 
     def add_bond(self, i, j, order=None):
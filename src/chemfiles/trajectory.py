@@ -1,8 +1,10 @@
 from ctypes import c_char_p, c_uint64
 
+import numpy as np
+
 from .frame import Frame, Topology
 from .misc import ChemfilesError
-from .utils import CxxPointer, _call_with_growing_buffer
+from .utils import CxxPointer, _aligned_empty, _call_with_growing_buffer
 
 
 class BaseTrajectory(CxxPointer):
@@ -50,6 +52,58 @@ class BaseTrajectory(CxxPointer):
         self.ffi.chfl_trajectory_read_step(self.mut_ptr, c_uint64(step), frame.mut_ptr)
         return frame
 
+    def read_many(self, count, out=None):
+        """
+        Read the next ``count`` steps of this :py:class:`Trajectory`, and
+        return a tuple ``(positions, steps)`` containing the positions of all
+        the atoms as a ``(count, natoms, 3)`` array, and the corresponding
+        frames steps as an array of ``count`` integers.
+
+        All the steps must contain the same number of atoms. If ``out`` is
+        given, it must be an array with ``(count, natoms, 3)`` shape, and the
+        positions will be written to it instead of a newly allocated array.
+        Newly allocated arrays are aligned on 64 bytes.
+
+        Chemfiles stores positions as ``np.float64``. ``out`` can also contain
+        ``np.float32``, in which case the positions are converted while being
+        copied, halving the size of the output.
+
+        A single :py:class:`Frame` is re-used to read all the steps, which
+        makes this faster than calling :py:func:`Trajectory.read` ``count``
+        times when only the positions are needed.
+        """
+        self.__check_opened()
+        if out is not None:
+            if out.ndim != 3 or out.shape[0] != count or out.shape[2] != 3:
+                raise ChemfilesError(
+                    f"expected the output array to have ({count}, natoms, 3) "
+                    f"shape, got {out.shape}"
+                )
+            if out.dtype != np.float64 and out.dtype != np.float32:
+                raise ChemfilesError(
+                    "expected the output array to contain np.float64 or "
+                    f"np.float32, got {out.dtype}"
+                )
+
+        frame = Frame()
+        steps = np.empty(count, np.uint64)
+        for i in range(count):
+            self.ffi.chfl_trajectory_read(self.mut_ptr, frame.mut_ptr)
+            positions = frame.positions
+            if out is None:
+                out = _aligned_empty((count, positions.shape[0], 3), np.float64)
+            elif out.shape[1] != positions.shape[0]:
+                raise ChemfilesError(
+                    f"expected {out.shape[1]} atoms in all steps, "
+                    f"got {positions.shape[0]} atoms at step {frame.step}"
+                )
+            out[i] = positions
+            steps[i] = frame.step
+
+        if out is None:
+            out = np.empty((0, 0, 3), np.float64)
+        return out, steps
+
     def write(self, frame):
         """Write a :py:class:`Frame` to this :py:class:`Trajectory`."""
         self.__check_opened()
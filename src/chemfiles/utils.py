@@ -1,9 +1,25 @@
-from ctypes import c_uint64, create_string_buffer
+from ctypes import create_string_buffer
+
+import numpy as np
 
 from ._c_lib import _get_c_library
 from .misc import ChemfilesError, _last_error
 
 
+class _CInterface(object):
+    """
+    Descriptor giving access to the C interface. The library is loaded on the
+    first access, and then stored directly as a class attribute of
+    :py:class:`CxxPointer`, making all later ``self.ffi`` lookups as cheap as
+    possible (no function call, no library lookup).
+    """
+
+    def __get__(self, instance, owner):
+        c_lib = _get_c_library()
+        CxxPointer.ffi = c_lib
+        return c_lib
+
+
 class CxxPointer(object):
     # Used to prevent adding new attributes to chemfiles objects
     __frozen = False
@@ -27,7 +43,10 @@ class CxxPointer(object):
 
     def __del__(self):
         """Free the memory associated with this instance"""
-        self.ffi.chfl_free(self.ptr)
+        # __del__ does not prevent the collection of reference cycles since
+        # Python 3.4 (PEP 442), and is cheaper than ``weakref.finalize``, which
+        # would need an additional object and registry entry per instance.
+        self.ffi.chfl_free(self.__ptr)
 
     def __setattr__(self, key, value):
         if self.__frozen and not hasattr(self, key):
@@ -39,15 +58,17 @@ class CxxPointer(object):
     @classmethod
     def from_mutable_ptr(cls, origin, ptr):
         """Create a new instance from a mutable pointer"""
+        # bypass the subclass __init__, which would allocate a new object
         new = cls.__new__(cls)
-        super(cls, new).__init__(ptr, is_const=False, origin=origin)
+        CxxPointer.__init__(new, ptr, is_const=False, origin=origin)
         return new
 
     @classmethod
     def from_const_ptr(cls, origin, ptr):
         """Create a new instance from a const pointer"""
+        # bypass the subclass __init__, which would allocate a new object
         new = cls.__new__(cls)
-        super(cls, new).__init__(ptr, is_const=True, origin=origin)
+        CxxPointer.__init__(new, ptr, is_const=True, origin=origin)
         return new
 
     @property
@@ -65,10 +86,8 @@ class CxxPointer(object):
         """Get the **const** C++ pointer for this object"""
         return self.__ptr
 
-    @property
-    def ffi(self):
-        """Allow to access the C interface from any instance of CxxPointer"""
-        return _get_c_library()
+    # Allow to access the C interface from any instance of CxxPointer
+    ffi = _CInterface()
 
     @classmethod
     def from_param(cls, parameter):
@@ -89,9 +108,9 @@ def _check_return_code(status, _function, _arguments):
 
 def _check_handle(handle):
     """Check that C allocated pointers are not NULL"""
-    try:
-        handle.contents
-    except ValueError:
+    # NULL ctypes pointers are falsy, this is cheaper than creating (and
+    # throwing away) a new object with ``handle.contents``
+    if not handle:
         raise ChemfilesError(_last_error())
 
 
@@ -109,12 +128,25 @@ def _call_with_growing_buffer(function, initial):
 
     size = initial
     buffer = create_string_buffer(b"\0", size)
-    function(buffer, c_uint64(size))
+    function(buffer, size)
 
     while not buffer_was_big_enough(buffer):
         # Grow the buffer and retry
         size *= 2
         buffer = create_string_buffer(b"\0", size)
-        function(buffer, c_uint64(size))
+        function(buffer, size)
 
     return buffer.value.decode("utf8")
+
+
+def _aligned_empty(shape, dtype, alignment=64):
+    """
+    Create a new uninitialized numpy array with the given ``shape`` and
+    ``dtype``, with data starting at an address which is a multiple of
+    ``alignment`` bytes.
+    """
+    dtype = np.dtype(dtype)
+    size = int(np.prod(shape)) * dtype.itemsize
+    buffer = np.empty(size + alignment, dtype=np.uint8)
+    offset = -buffer.ctypes.data % alignment
+    return buffer[offset : offset + size].view(dtype).reshape(shape)
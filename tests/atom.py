@@ -3,7 +3,7 @@ import unittest
 
 from _utils import remove_warnings
 
-from chemfiles import Atom, ChemfilesError
+from chemfiles import Atom, ChemfilesError, Frame
 
 
 class TestAtom(unittest.TestCase):
@@ -53,12 +53,18 @@ class TestAtom(unittest.TestCase):
         atom.mass = 1.0
         self.assertEqual(atom.mass, 1.0)
 
+        with self.assertRaises(TypeError):
+            atom.mass = "foo"
+
     def test_charge(self):
         atom = Atom("He")
         self.assertEqual(atom.charge, 0.0)
         atom.charge = -1.5
         self.assertEqual(atom.charge, -1.5)
 
+        with self.assertRaises(TypeError):
+            atom.charge = "foo"
+
     def test_radii(self):
         self.assertAlmostEqual(Atom("He").vdw_radius, 1.4, 2)
         self.assertAlmostEqual(Atom("He").covalent_radius, 0.32, 3)
@@ -99,6 +105,23 @@ class TestAtom(unittest.TestCase):
         self.assertEqual(atom.properties_count(), 2)
         self.assertEqual(set(atom.list_properties()), {"bar", "foo"})
 
+    def test_subclass_from_ptr(self):
+        class MyAtom(Atom):
+            def __init__(self, name):
+                raise AssertionError("MyAtom.__init__ should not be called")
+
+        frame = Frame()
+        frame.add_atom(Atom("Zn"), (0, 0, 0))
+
+        ptr = frame.ffi.chfl_atom_from_frame(frame.mut_ptr, 0)
+        atom = MyAtom.from_mutable_ptr(frame, ptr)
+        self.assertIsInstance(atom, MyAtom)
+        self.assertEqual(atom.name, "Zn")
+
+        # the new instance wraps the atom inside the frame, not a new C object
+        atom.name = "Fe"
+        self.assertEqual(frame.atoms[0].name, "Fe")
+
 
 if __name__ == "__main__":
     unittest.main()
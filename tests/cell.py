@@ -1,6 +1,7 @@
 import copy
 import unittest
 
+import numpy as np
 from _utils import remove_warnings
 
 from chemfiles import CellShape, ChemfilesError, UnitCell
@@ -79,6 +80,16 @@ class TestUnitCell(unittest.TestCase):
         for i in range(3):
             self.assertAlmostEqual(cell.angles[i], (80, 75, 122)[i])
 
+        # non-contiguous arrays and nested lists are also accepted
+        cell = UnitCell(np.asfortranarray(matrix))
+        self.assertEqual(cell.lengths, (3, 4, 5))
+        for i in range(3):
+            self.assertAlmostEqual(cell.angles[i], (80, 75, 122)[i])
+
+        cell = UnitCell([[3, 0, 0], [0, 4, 0], [0, 0, 5]])
+        self.assertEqual(cell.lengths, (3, 4, 5))
+        self.assertEqual(cell.angles, (90, 90, 90))
+
     def test_shape(self):
         cell = UnitCell([3, 4, 5])
         self.assertEqual(cell.shape, CellShape.Orthorhombic)
@@ -97,6 +108,9 @@ class TestUnitCell(unittest.TestCase):
         self.assertEqual(wrapped[1], 1.0)
         self.assertEqual(wrapped[2], -0.5)
 
+        with self.assertRaises(IndexError):
+            cell.wrap((1, 2))
+
 
 if __name__ == "__main__":
     unittest.main()
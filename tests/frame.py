@@ -1,6 +1,8 @@
 import copy
+import gc
 import math
 import unittest
+import weakref
 
 import numpy as np
 from _utils import remove_warnings
@@ -60,6 +62,19 @@ class TestFrame(unittest.TestCase):
         self.assertEqual(list(frame.positions[1]), [-3, -4, 5])
         self.assertEqual(list(frame.velocities[1]), [1, 0, 1])
 
+        # numpy arrays can be used directly for positions and velocities
+        frame.add_atom(Atom("F"), np.array([1, 2, 3]), np.array([0.0, 0.0, 0.0]))
+        self.assertEqual(list(frame.positions[2]), [1, 2, 3])
+        self.assertEqual(list(frame.velocities[2]), [0, 0, 0])
+
+        # positions and velocities must have three components
+        with self.assertRaises(IndexError):
+            frame.add_atom(Atom("F"), (1, 2))
+
+        with self.assertRaises(IndexError):
+            frame.add_atom(Atom("F"), (1, 2, 3), (1, 2))
+        self.assertEqual(len(frame.atoms), 3)
+
     def test_positions(self):
         frame = Frame()
         frame.resize(4)
@@ -69,13 +84,55 @@ class TestFrame(unittest.TestCase):
             np.float64,
         )
         np.copyto(frame.positions, expected)
-        self.assertEqual(frame.positions.all(), expected.all())
+        np.testing.assert_array_equal(frame.positions, expected)
 
         frame.positions[3, 2] = 42
         self.assertEqual(frame.positions[3, 2], 42)
 
         # Checking empty frame positions access
-        _ = Frame().positions
+        self.assertEqual(Frame().positions.shape, (0, 3))
+
+    def test_positions_lifetime(self):
+        frame = Frame()
+        frame.resize(4)
+        frame_ref = weakref.ref(frame)
+
+        # the positions array keeps the frame alive
+        positions = frame.positions
+        del frame
+        gc.collect()
+        self.assertIsNotNone(frame_ref())
+
+        positions[3, 2] = 42
+        self.assertEqual(frame_ref().positions[3, 2], 42)
+
+        del positions
+        gc.collect()
+        self.assertIsNone(frame_ref())
+
+    def test_positions_soa(self):
+        frame = Frame()
+        frame.add_atom(Atom(""), (1, 2, 3))
+        frame.add_atom(Atom(""), (4, 5, 6))
+
+        x, y, z = frame.positions_soa()
+        self.assertEqual(list(x), [1, 4])
+        self.assertEqual(list(y), [2, 5])
+        self.assertEqual(list(z), [3, 6])
+        self.assertTrue(x.flags.c_contiguous)
+        for array in (x, y, z):
+            self.assertEqual(array.ctypes.data % 64, 0)
+
+        # this is a copy of the positions
+        x[0] = 42
+        self.assertEqual(frame.positions[0, 0], 1)
+
+        x, y, z = frame.positions_soa(dtype=np.float32)
+        self.assertEqual(x.dtype, np.float32)
+        self.assertEqual(list(y), [2, 5])
+
+        x, y, z = Frame().positions_soa()
+        self.assertEqual(x.shape, (0,))
 
     def test_velocities(self):
         frame = Frame()
@@ -90,7 +147,7 @@ class TestFrame(unittest.TestCase):
             np.float64,
         )
         np.copyto(frame.velocities, expected)
-        self.assertEqual(frame.velocities.all(), expected.all())
+        np.testing.assert_array_equal(frame.velocities, expected)
 
         frame.velocities[3, 2] = 42
         self.assertEqual(frame.velocities[3, 2], 42)
@@ -98,7 +155,7 @@ class TestFrame(unittest.TestCase):
         # Checking empty frame velocities access
         frame = Frame()
         frame.add_velocities()
-        _ = frame.velocities
+        self.assertEqual(frame.velocities.shape, (0, 3))
 
     def test_cell(self):
         frame = Frame()
@@ -128,6 +185,9 @@ class TestFrame(unittest.TestCase):
         frame.step = 42
         self.assertEqual(frame.step, 42)
 
+        with self.assertRaises(TypeError):
+            frame.step = 1.5
+
     def test_out_of_bounds(self):
         frame = Frame()
         frame.resize(3)
@@ -184,6 +244,48 @@ class TestFrame(unittest.TestCase):
 
         self.assertEqual(frame.distance(0, 1), math.sqrt(6.0))
 
+    def test_pairwise_distances(self):
+        frame = Frame()
+        frame.add_atom(Atom(""), (0, 0, 0))
+        frame.add_atom(Atom(""), (1, 2, 6))
+        frame.add_atom(Atom(""), (2.5, -1, 3))
+
+        def check_against_distance():
+            distances = frame.pairwise_distances()
+            self.assertEqual(distances.shape, (3, 3))
+            for i in range(3):
+                for j in range(3):
+                    self.assertAlmostEqual(distances[i, j], frame.distance(i, j))
+
+        frame.cell = UnitCell([3.0, 4.0, 5.0])
+        check_against_distance()
+
+        # the triclinic kernel gives the same result for orthogonal axes
+        orthorhombic = frame.pairwise_distances()
+        frame.cell.shape = CellShape.Triclinic
+        np.testing.assert_allclose(frame.pairwise_distances(), orthorhombic)
+
+        frame.cell = UnitCell([3.0, 4.0, 5.0], [80.0, 95.0, 110.0])
+        check_against_distance()
+
+        frame.cell = UnitCell([0.0, 0.0, 0.0])
+        self.assertEqual(frame.cell.shape, CellShape.Infinite)
+        check_against_distance()
+
+        frame.cell.shape = CellShape.Triclinic
+        with self.assertRaises(ChemfilesError):
+            frame.pairwise_distances()
+
+    def test_center_of_mass(self):
+        frame = Frame()
+        frame.add_atom(Atom("O"), (0, 0, 0))
+        frame.add_atom(Atom("H"), (1, 0, 0))
+        frame.add_atom(Atom("H"), (0, 1, 0))
+
+        masses = [atom.mass for atom in frame.atoms]
+        expected = np.average(frame.positions, axis=0, weights=masses)
+        np.testing.assert_allclose(frame.center_of_mass(), expected)
+
     def test_angle(self):
         frame = Frame()
         frame.add_atom(Atom(""), (1, 0, 0))
@@ -222,9 +324,7 @@ class TestFrame(unittest.TestCase):
         frame.add_bond(3, 4)
         frame.add_bond(2, 1, BondOrder.Quintuplet)
 
-        self.assertEqual(
-            frame.topology.bonds.all(), np.array([[0, 1], [1, 2], [3, 4]]).all()
-        )
+        np.testing.assert_array_equal(frame.topology.bonds, [[0, 1], [1, 2], [3, 4]])
 
         self.assertEqual(
             frame.topology.bonds_orders,
@@ -236,7 +336,7 @@ class TestFrame(unittest.TestCase):
         frame.remove_bond(3, 4)
         frame.remove_bond(0, 4)
 
-        self.assertEqual(frame.topology.bonds.all(), np.array([[0, 1], [1, 2]]).all())
+        np.testing.assert_array_equal(frame.topology.bonds, [[0, 1], [1, 2]])
 
         frame.clear_bonds()
         self.assertEqual(frame.topology.bonds_count(), 0)
@@ -0,0 +1,59 @@
+import unittest
+
+import numpy as np
+
+from chemfiles import _kernels
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+@unittest.skipUnless(numba, "numba is not installed")
+class TestNumbaKernels(unittest.TestCase):
+    def setUp(self):
+        from chemfiles import _numba_kernels
+
+        self.numba = _numba_kernels
+
+        rng = np.random.default_rng(0)
+        self.x, self.y, self.z = rng.uniform(-10, 20, size=(3, 50))
+        self.masses = rng.uniform(1, 20, size=50)
+
+    def test_pairwise_distances_infinite(self):
+        args = (self.x, self.y, self.z)
+        np.testing.assert_allclose(
+            self.numba._pairwise_distances_infinite_numba(*args),
+            _kernels._pairwise_distances_infinite_numpy(*args),
+            rtol=1e-12,
+        )
+
+    def test_pairwise_distances_orthorhombic(self):
+        args = (self.x, self.y, self.z, np.array([7.0, 8.0, 9.0]))
+        np.testing.assert_allclose(
+            self.numba._pairwise_distances_orthorhombic_numba(*args),
+            _kernels._pairwise_distances_orthorhombic_numpy(*args),
+            rtol=1e-12,
+        )
+
+    def test_pairwise_distances_triclinic(self):
+        matrix = np.array([[7.0, 1.5, -0.5], [0.0, 8.0, 2.0], [0.0, 0.0, 9.0]])
+        args = (self.x, self.y, self.z, matrix, np.linalg.inv(matrix))
+        np.testing.assert_allclose(
+            self.numba._pairwise_distances_triclinic_numba(*args),
+            _kernels._pairwise_distances_triclinic_numpy(*args),
+            rtol=1e-12,
+        )
+
+    def test_center_of_mass(self):
+        args = (self.x, self.y, self.z, self.masses)
+        np.testing.assert_allclose(
+            self.numba._center_of_mass_numba(*args),
+            _kernels._center_of_mass_numpy(*args),
+            rtol=1e-12,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -57,6 +57,11 @@ class TestTopology(unittest.TestCase):
         del topology.atoms[4]
         self.assertEqual(len(topology.atoms), 6)
 
+        topology.atoms.extend([Atom("Zn"), Atom("Cs")])
+        self.assertEqual(len(topology.atoms), 8)
+        self.assertEqual(topology.atoms[6].name, "Zn")
+        self.assertEqual(topology.atoms[7].name, "Cs")
+
     def test_bonds(self):
         topology = Topology()
         topology.resize(4)
@@ -67,7 +72,7 @@ class TestTopology(unittest.TestCase):
         topology.add_bond(2, 3)
 
         self.assertEqual(topology.bonds_count(), 3)
-        self.assertEqual(topology.bonds.all(), np.array([[2, 3], [1, 2], [0, 1]]).all())
+        np.testing.assert_array_equal(topology.bonds, [[0, 1], [1, 2], [2, 3]])
 
         topology.remove_bond(2, 3)
         self.assertEqual(topology.bonds_count(), 2)
@@ -99,7 +104,7 @@ class TestTopology(unittest.TestCase):
         topology.add_bond(2, 3)
 
         self.assertEqual(topology.angles_count(), 2)
-        self.assertEqual(topology.angles.all(), np.array([[0, 1, 2], [1, 2, 3]]).all())
+        np.testing.assert_array_equal(topology.angles, [[0, 1, 2], [1, 2, 3]])
 
     def test_dihedrals(self):
         topology = Topology()
@@ -111,7 +116,7 @@ class TestTopology(unittest.TestCase):
         topology.add_bond(2, 3)
 
         self.assertEqual(topology.dihedrals_count(), 1)
-        self.assertEqual(topology.dihedrals.all(), np.array([[0, 1, 2, 3]]).all())
+        np.testing.assert_array_equal(topology.dihedrals, [[0, 1, 2, 3]])
 
     def test_impropers(self):
         topology = Topology()
@@ -123,7 +128,7 @@ class TestTopology(unittest.TestCase):
         topology.add_bond(1, 3)
 
         self.assertEqual(topology.impropers_count(), 1)
-        self.assertEqual(topology.impropers.all(), np.array([[0, 1, 2, 3]]).all())
+        np.testing.assert_array_equal(topology.impropers, [[0, 1, 2, 3]])
 
     def test_out_of_bounds(self):
         topology = Topology()
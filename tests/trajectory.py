@@ -65,11 +65,11 @@ class TestTrajectory(unittest.TestCase):
         frame = trajectory.read()
         self.assertEqual(len(frame.atoms), 297)
 
-        self.assertEqual(
-            frame.positions[0].all(), np.array([0.417219, 8.303366, 11.737172]).all()
+        np.testing.assert_allclose(
+            frame.positions[0], [0.417219, 8.303366, 11.737172], atol=1e-5
         )
-        self.assertEqual(
-            frame.positions[124].all(), np.array([5.099554, -0.045104, 14.153846]).all()
+        np.testing.assert_allclose(
+            frame.positions[124], [5.099554, -0.045104, 14.153846], atol=1e-5
         )
 
         self.assertEqual(len(frame.atoms), 297)
@@ -80,11 +80,11 @@ class TestTrajectory(unittest.TestCase):
         frame = trajectory.read_step(41)
         self.assertEqual(frame.cell.lengths, (30.0, 30.0, 30.0))
 
-        self.assertEqual(
-            frame.positions[0].all(), np.array([0.761277, 8.106125, 10.622949]).all()
+        np.testing.assert_allclose(
+            frame.positions[0], [0.761277, 8.106125, 10.622949], atol=1e-5
         )
-        self.assertEqual(
-            frame.positions[124].all(), np.array([5.13242, 0.079862, 14.194161]).all()
+        np.testing.assert_allclose(
+            frame.positions[124], [5.13242, 0.079862, 14.194161], atol=1e-5
         )
 
         self.assertEqual(len(frame.atoms), 297)
@@ -95,8 +95,7 @@ class TestTrajectory(unittest.TestCase):
         self.assertEqual(frame.topology.angles_count(), 84)
 
         topology = Topology()
-        for i in range(297):
-            topology.atoms.append(Atom("Cs"))
+        topology.atoms.extend([Atom("Cs")] * 297)
 
         trajectory.set_topology(topology)
         frame = trajectory.read_step(10)
@@ -106,6 +105,47 @@ class TestTrajectory(unittest.TestCase):
         frame = trajectory.read()
         self.assertEqual(frame.atoms[100].name, "Rd")
 
+    def test_read_many(self):
+        trajectory = Trajectory(get_data_path("water.xyz"))
+        # keep the frames alive while copying their positions
+        frame = trajectory.read()
+        first = frame.positions.copy()
+        frame = trajectory.read()
+        second = frame.positions.copy()
+
+        trajectory = Trajectory(get_data_path("water.xyz"))
+        positions, steps = trajectory.read_many(2)
+        self.assertEqual(positions.shape, (2, 297, 3))
+        self.assertEqual(positions.ctypes.data % 64, 0)
+        self.assertEqual(list(steps), [0, 1])
+        np.testing.assert_array_equal(positions[0], first)
+        np.testing.assert_array_equal(positions[1], second)
+
+        # re-use an existing array
+        out = np.empty((3, 297, 3))
+        positions, steps = trajectory.read_many(3, out=out)
+        self.assertIs(positions, out)
+        self.assertEqual(list(steps), [2, 3, 4])
+
+        with self.assertRaises(ChemfilesError):
+            trajectory.read_many(3, out=np.empty((2, 297, 3)))
+
+        # single precision output
+        trajectory = Trajectory(get_data_path("water.xyz"))
+        out = np.empty((2, 297, 3), np.float32)
+        positions, steps = trajectory.read_many(2, out=out)
+        self.assertIs(positions, out)
+        self.assertEqual(positions.dtype, np.float32)
+        self.assertEqual(list(steps), [0, 1])
+        np.testing.assert_allclose(out[0], first.astype(np.float32))
+        np.testing.assert_allclose(out[1], second.astype(np.float32))
+
+        with self.assertRaises(ChemfilesError):
+            trajectory.read_many(2, out=np.empty((2, 297, 3), np.int32))
+
+        with self.assertRaises(ChemfilesError):
+            trajectory.read_many(2, out=np.empty((2, 12, 3)))
+
     def test_protocols(self):
         with Trajectory(get_data_path("water.xyz")) as trajectory:
             for frame in trajectory: